@@ -101,25 +101,14 @@ class BaseScraper(ABC):
         """
         self.config = config
         self.session = self._create_session()
+        self._install_retry_adapter()
         self.products: List[Product] = []
         self.failed_urls: List[Tuple[str, str]] = []  # (url, error_message)
 
     def _create_session(self) -> requests.Session:
-        """Create requests session with retry strategy"""
+        """Create requests session with default headers"""
         session = requests.Session()
 
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=self.config.retry_attempts,
-            backoff_factor=self.config.retry_backoff,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET"],
-        )
-
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-
         # Set headers
         session.headers.update(
             {
@@ -133,6 +122,19 @@ class BaseScraper(ABC):
 
         return session
 
+    def _install_retry_adapter(self) -> None:
+        """Mount an HTTP adapter with the configured retry strategy on the session"""
+        retry_strategy = Retry(
+            total=self.config.retry_attempts,
+            backoff_factor=self.config.retry_backoff,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+        )
+
+        adapter = HTTPAdapter(max_retries=retry_strategy)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def _fetch_page(self, url: str) -> Optional[requests.Response]:
         """
         Fetch a page with rate limiting, retry logic, and error handling.
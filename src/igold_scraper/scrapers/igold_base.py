@@ -9,7 +9,7 @@ import logging
 from typing import Optional, List, Dict
 from urllib.parse import urljoin, urlparse
 
-from lxml import html
+from lxml import etree, html
 
 from igold_scraper.scrapers.base import BaseScraper, ScraperConfig, Product
 from igold_scraper.config import get_config
@@ -18,6 +18,20 @@ from igold_scraper.constants import xpaths
 
 logger = logging.getLogger(__name__)
 
+# XPath selectors compiled once at import; evaluated per page by calling them on a tree
+_XPATH_CATEGORY_PRODUCT_LINKS = etree.XPath(xpaths.CATEGORY_PRODUCT_LINKS)
+_XPATH_CATEGORY_PRODUCT_ELEMENTS = etree.XPath(xpaths.CATEGORY_PRODUCT_ELEMENTS)
+_XPATH_CATEGORY_PRODUCT_TITLE = etree.XPath(xpaths.CATEGORY_PRODUCT_TITLE)
+_XPATH_CATEGORY_PRODUCT_ITEMS = etree.XPath(xpaths.CATEGORY_PRODUCT_ITEMS)
+_XPATH_CATEGORY_ITEM_URL = etree.XPath(xpaths.CATEGORY_ITEM_URL)
+_XPATH_CATEGORY_ITEM_BUY_PRICE_EUR = etree.XPath(xpaths.CATEGORY_ITEM_BUY_PRICE_EUR)
+_XPATH_CATEGORY_ITEM_SELL_PRICE_EUR = etree.XPath(xpaths.CATEGORY_ITEM_SELL_PRICE_EUR)
+_XPATH_PRODUCT_TITLE = etree.XPath(xpaths.PRODUCT_TITLE)
+_XPATH_PRICE_SELL_EUR = etree.XPath(xpaths.PRICE_SELL_EUR)
+_XPATH_PRICE_BUY_EUR = etree.XPath(xpaths.PRICE_BUY_EUR)
+_XPATH_PRODUCT_DETAILS_CONTAINER = etree.XPath(xpaths.PRODUCT_DETAILS_CONTAINER)
+_XPATH_PRODUCT_DETAILS_PARAGRAPHS = etree.XPath(xpaths.PRODUCT_DETAILS_PARAGRAPHS)
+
 
 class IgoldBaseScraper(BaseScraper):
     """
@@ -66,7 +80,7 @@ class IgoldBaseScraper(BaseScraper):
         tree = html.fromstring(response.content)
 
         # Extract product links
-        product_hrefs = tree.xpath(xpaths.CATEGORY_PRODUCT_LINKS)
+        product_hrefs = _XPATH_CATEGORY_PRODUCT_LINKS(tree)
 
         # Convert to absolute URLs
         product_urls = [urljoin(self.base_url, href) for href in product_hrefs]
@@ -75,9 +89,9 @@ class IgoldBaseScraper(BaseScraper):
 
         # Log titles in debug mode
         if logger.level <= logging.DEBUG and product_urls:
-            product_links = tree.xpath(xpaths.CATEGORY_PRODUCT_ELEMENTS)
+            product_links = _XPATH_CATEGORY_PRODUCT_ELEMENTS(tree)
             for link in product_links:
-                h2_text = link.xpath(xpaths.CATEGORY_PRODUCT_TITLE)
+                h2_text = _XPATH_CATEGORY_PRODUCT_TITLE(link)
                 if h2_text:
                     url = urljoin(self.base_url, link.get("href"))
                     logger.debug("  Found: %s -> %s", h2_text.strip(), url)
@@ -103,13 +117,13 @@ class IgoldBaseScraper(BaseScraper):
         tree = html.fromstring(response.content)
 
         # Extract product items
-        product_items = tree.xpath(xpaths.CATEGORY_PRODUCT_ITEMS)
+        product_items = _XPATH_CATEGORY_PRODUCT_ITEMS(tree)
 
         prices = []
         for item in product_items:
             try:
                 # Extract URL
-                url = item.xpath(xpaths.CATEGORY_ITEM_URL)
+                url = _XPATH_CATEGORY_ITEM_URL(item)
                 if not url:
                     continue
 
@@ -119,8 +133,8 @@ class IgoldBaseScraper(BaseScraper):
                     url = parsed.path
 
                 # Extract prices
-                buy_price_str = item.xpath(xpaths.CATEGORY_ITEM_BUY_PRICE_EUR)
-                sell_price_str = item.xpath(xpaths.CATEGORY_ITEM_SELL_PRICE_EUR)
+                buy_price_str = _XPATH_CATEGORY_ITEM_BUY_PRICE_EUR(item)
+                sell_price_str = _XPATH_CATEGORY_ITEM_SELL_PRICE_EUR(item)
 
                 # Parse prices (remove "€" and whitespace, handle various formats)
                 buy_price_eur = None
@@ -181,7 +195,7 @@ class IgoldBaseScraper(BaseScraper):
         tree = html.fromstring(response.content)
 
         # Extract title
-        title = tree.xpath(xpaths.PRODUCT_TITLE).strip()
+        title = _XPATH_PRODUCT_TITLE(tree).strip()
         title = re.sub(r"\s+", " ", title)
 
         if not title:
@@ -257,7 +271,7 @@ class IgoldBaseScraper(BaseScraper):
 
         # Sell prices
         try:
-            sell_eur_str = tree.xpath(xpaths.PRICE_SELL_EUR).strip()
+            sell_eur_str = _XPATH_PRICE_SELL_EUR(tree).strip()
             if sell_eur_str:
                 # Remove EUR symbol and whitespace, handle various formats
                 cleaned = (
@@ -272,7 +286,7 @@ class IgoldBaseScraper(BaseScraper):
 
         # Buy prices
         try:
-            buy_eur_str = tree.xpath(xpaths.PRICE_BUY_EUR).strip()
+            buy_eur_str = _XPATH_PRICE_BUY_EUR(tree).strip()
             if buy_eur_str:
                 # Remove EUR symbol and any whitespace, handle various formats
                 cleaned = buy_eur_str.replace('€', '').replace('\xa0', '').replace(',', '.').strip()
@@ -294,10 +308,10 @@ class IgoldBaseScraper(BaseScraper):
         """
         details_dict = {}
 
-        details_container = tree.xpath(xpaths.PRODUCT_DETAILS_CONTAINER)
+        details_container = _XPATH_PRODUCT_DETAILS_CONTAINER(tree)
 
         if details_container:
-            paragraphs = details_container[0].xpath(xpaths.PRODUCT_DETAILS_PARAGRAPHS)
+            paragraphs = _XPATH_PRODUCT_DETAILS_PARAGRAPHS(details_container[0])
             for p in paragraphs:
                 text = p.text_content().strip()
                 if text and ":" in text:
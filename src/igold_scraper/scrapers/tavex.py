@@ -16,7 +16,7 @@ import json
 import logging
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html
 
 # Import configuration
 from igold_scraper.config import get_config
@@ -33,6 +33,20 @@ logger = logging.getLogger(__name__)
 config = get_config()
 
 
+def _page_encoding(response: requests.Response) -> str:
+    """
+    Pick the charset to decode a tavex.bg page with.
+
+    Without a hint lxml decodes bytes as Latin-1, garbling the Bulgarian product names, and
+    requests reports ISO-8859-1 for any text/* response lacking a charset. Only trust
+    response.encoding when the Content-Type header declares a charset; otherwise use UTF-8,
+    which tavex.bg serves.
+    """
+    if response.encoding and "charset=" in response.headers.get("Content-Type", "").lower():
+        return response.encoding
+    return "utf-8"
+
+
 def scrape_tavex_gold_products() -> list:
     """
     Scrape gold product information from tavex.bg.
@@ -57,18 +71,22 @@ def scrape_tavex_gold_products() -> list:
         logger.exception("Failed to fetch data: %s", e)
         return []
 
-    # Parse the HTML content
-    soup = BeautifulSoup(response.content, "html.parser")
+    # Parse the HTML content; lxml raises on an empty or whitespace-only body
+    try:
+        tree = html.fromstring(response.content, parser=html.HTMLParser(encoding=_page_encoding(response)))
+    except etree.ParserError as e:
+        logger.error("Could not parse response from %s: %s", url, e)
+        return []
 
     # Find the modal div with gold products
-    modal_div = soup.find("div", {"id": "modaal-add-price-alert"})
+    modal_div = tree.find('.//div[@id="modaal-add-price-alert"]')
 
-    if not modal_div:
+    if modal_div is None:
         logger.error("Modal div not found - website structure may have changed")
         return []
 
     # Find all option elements inside the modal div
-    options = modal_div.find_all("option")
+    options = list(modal_div.iter("option"))
 
     gold_products = []
     error_count = 0
@@ -81,11 +99,11 @@ def scrape_tavex_gold_products() -> list:
             continue
 
         # Get product name
-        name = option.text.strip()
+        name = option.text_content().strip()
 
         # Get price data
         try:
-            price_data = json.loads(option["data-pricelist"])
+            price_data = json.loads(option.get("data-pricelist"))
 
             # Extract buy price (first item in the buy array)
             buy_price = None
@@ -10,6 +10,7 @@ import csv
 import glob
 import argparse
 from datetime import datetime, timedelta
+from pathlib import Path
 import logging
 
 from igold_scraper.config import DEFAULT_DATA_DIR
@@ -100,14 +101,14 @@ def cleanup_old_data():
     cutoff_date = datetime.now() - timedelta(days=180)  # 6 months
     cutoff_str = cutoff_date.strftime('%Y-%m-%d')
 
-    for metal_type in ['gold', 'silver']:
-        data_dir = f"data/{metal_type}"
-        if os.path.exists(data_dir):
-            for file in glob.glob(f"{data_dir}/*.json"):
-                filename = os.path.basename(file)
-                if filename.replace('.json', '') < cutoff_str:
-                    logger.info("Removing old data file: %s", file)
-                    os.remove(file)
+    # Files are named YYYY-MM-DD.json, so the stem compares correctly as a string
+    for metal_type in [DATA_DIR_GOLD, DATA_DIR_SILVER]:
+        data_dir = Path(DEFAULT_DATA_DIR) / metal_type
+        if data_dir.exists():
+            for path in data_dir.glob("*.json"):
+                if path.stem < cutoff_str:
+                    logger.info("Removing old data file: %s", path)
+                    path.unlink()
 
 def main():
     """Main entry point for data management CLI."""
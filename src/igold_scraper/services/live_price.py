@@ -10,8 +10,9 @@ import logging
 import os
 import sys
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
+import orjson
 import requests
 
 from igold_scraper.config import DEFAULT_DATA_DIR
@@ -65,6 +66,29 @@ class LivePriceFetcher:
         if not spread_prices:
             raise ValidationError(f"No spread profile prices found for {metal}")
 
+    def _parse_response(self, content: bytes) -> Any:
+        """
+        Decode a JSON API response body.
+
+        Args:
+            content: Raw response body
+
+        Returns:
+            Decoded JSON data (a JSON null decodes to None)
+
+        Raises:
+            requests.exceptions.JSONDecodeError: If the body is not valid JSON, as response.json() raised
+        """
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+        # orjson rejects NaN/Infinity and non-UTF-8 bodies, which response.json() accepted
+        try:
+            return json.loads(content)
+        except json.JSONDecodeError as e:
+            raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
     def fetch_live_price(self, metal: str = 'XAU') -> Optional[Dict]:
         """
         Fetch current metal price from the API
@@ -78,7 +102,7 @@ class LivePriceFetcher:
         try:
             response = requests.get(api_url, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = self._parse_response(response.content)
 
             # Validate response structure
             self._validate_api_response(data, metal)
@@ -166,8 +190,8 @@ class LivePriceFetcher:
 
             # If file exists for today, append to it (for historical tracking)
             if os.path.exists(filename):
-                with open(filename, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
+                with open(filename, 'rb') as f:
+                    existing_data = orjson.loads(f.read())
                     if not isinstance(existing_data, list):
                         existing_data = [existing_data]
                 existing_data.append(price_data)
@@ -175,13 +199,14 @@ class LivePriceFetcher:
             else:
                 data_to_save = [price_data]
 
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data_to_save, f, ensure_ascii=False, indent=2)
+            # orjson always writes UTF-8 (no ASCII escaping), matching the old ensure_ascii=False output
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data_to_save, option=orjson.OPT_INDENT_2))
 
             logger.info("Saved live %s price data to %s", metal_name, filename)
             return True
 
-        except (OSError, json.JSONDecodeError, ValueError) as e:
+        except (OSError, orjson.JSONDecodeError, ValueError) as e:
             logger.exception("Failed to save price data: %s", e)
             return False
 
@@ -0,0 +1,222 @@
+"""Shared scrapers, sample pages and response stubs for scraper tests."""
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+from src.igold_scraper.scrapers.gold import IgoldGoldScraper
+from src.igold_scraper.scrapers.silver import IgoldSilverScraper
+
+
+@dataclass(slots=True, frozen=True)
+class FakeResponse:
+    """Minimal stand-in for requests.Response as used by the scrapers."""
+
+    content: bytes
+    status_code: int = 200
+
+    def raise_for_status(self) -> None:
+        """No-op; use http_404_response for a response that raises."""
+
+
+@pytest.fixture(scope="session")
+def fake_response():
+    """Factory building FakeResponse objects: fake_response(content=..., status_code=...)."""
+    return FakeResponse
+
+
+@pytest.fixture(scope="session")
+def build_scraper(_mock_sess_proto):
+    """Factory constructing a scraper class around the shared mock session: build_scraper(cls)."""
+    def build(scraper_cls):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(requests, "Session", lambda *a, **kw: _mock_sess_proto)
+            return scraper_cls()
+
+    return build
+
+
+@pytest.fixture(scope="module")
+def scrapers(build_scraper):  # pylint: disable=redefined-outer-name
+    """One gold and one silver scraper per module, keyed by class."""
+    return {cls: build_scraper(cls) for cls in (IgoldGoldScraper, IgoldSilverScraper)}
+
+
+def _raise_network_error(*_args, **_kwargs):
+    """Stand-in for session.get when the network is down."""
+    raise requests.ConnectionError("Network error")
+
+
+@pytest.fixture
+def network_down(mock_scraper_session):
+    """Make every GET on the mock scraper session fail with ConnectionError."""
+    mock_scraper_session.get = _raise_network_error
+
+
+_FIXTURES_DIR = Path(__file__).parent / "_fixtures"
+
+
+@cache
+def _load(name: str) -> bytes:
+    """Read a sample page from _fixtures, once per process."""
+    return (_FIXTURES_DIR / name).read_bytes()
+
+
+_GOLD_FINE_LABEL = "Чисто злато"
+_SILVER_FINE_LABEL = "Чисто сребро"
+
+# Values that differ between the sample product pages; the rest comes from the template
+_VARIANTS = {
+    'gold_coin': {
+        'metal': 'gold', 'title': 'Test Gold Coin', 'heading': '31.1 гр. Златна Монета Тест Монета',
+        'sell_eur': '3833.33', 'sell_bgn': '7500.00', 'buy_eur': '3680.00', 'buy_bgn': '7200.00',
+        'weight': '31.1', 'purity': '999', 'fine_label': _GOLD_FINE_LABEL, 'fine_weight': '31.1',
+    },
+    'gold_bar': {
+        'metal': 'gold', 'title': 'Test Gold Bar', 'heading': '10 гр. Златно Кюлче Тест Производител',
+        'sell_eur': '1277.95', 'sell_bgn': '2500.00', 'buy_eur': '1226.61', 'buy_bgn': '2400.00',
+        'weight': '10', 'purity': '999.9', 'fine_label': _GOLD_FINE_LABEL, 'fine_weight': '10',
+    },
+    'gold_product': {
+        'metal': 'gold', 'title': 'Test Gold Product', 'heading': '3.99 гр. Златна Монета Тест',
+        'sell_eur': '486.75', 'sell_bgn': '952.00', 'buy_eur': '466.81', 'buy_bgn': '913.00',
+        'weight': '3.99', 'purity': '916.7', 'fine_label': _GOLD_FINE_LABEL, 'fine_weight': '3.66',
+    },
+    'silver_coin': {
+        'metal': 'silver', 'title': 'Test Silver Coin', 'heading': '31.1 гр. Сребърна Монета Тест Монета',
+        'sell_eur': '92.00', 'sell_bgn': '180.00', 'buy_eur': '84.36', 'buy_bgn': '165.00',
+        'weight': '31.1', 'purity': '999', 'fine_label': _SILVER_FINE_LABEL, 'fine_weight': '31.1',
+    },
+    'silver_bar': {
+        'metal': 'silver', 'title': 'Test Silver Bar', 'heading': '100 гр. Сребърно Кюлче Тест Производител',
+        'sell_eur': '281.19', 'sell_bgn': '550.00', 'buy_eur': '255.62', 'buy_bgn': '500.00',
+        'weight': '100', 'purity': '999.9', 'fine_label': _SILVER_FINE_LABEL, 'fine_weight': '100',
+    },
+    'silver_product': {
+        'metal': 'silver', 'title': 'Test Silver Product', 'heading': '31.1 гр. Сребърна Монета Тест',
+        'sell_eur': '38.62', 'sell_bgn': '75.50', 'buy_eur': '30.68', 'buy_bgn': '60.00',
+        'weight': '31.1', 'purity': '999', 'fine_label': _SILVER_FINE_LABEL, 'fine_weight': '31.06',
+    },
+}
+
+_PRODUCT_TEMPLATE = _load("product_template.html").decode("utf-8")
+
+_PRODUCT_PAGES = {
+    name: _PRODUCT_TEMPLATE.format(**fields).encode("utf-8") for name, fields in _VARIANTS.items()
+}
+
+
+@pytest.fixture(scope="session")
+def render_product_page():
+    """Render the product page template for a metal; fields fill the remaining placeholders."""
+    def render(metal, **fields):
+        fine_label = _GOLD_FINE_LABEL if metal == 'gold' else _SILVER_FINE_LABEL
+        return _PRODUCT_TEMPLATE.format(fine_label=fine_label, **fields).encode("utf-8")
+
+    return render
+
+
+@pytest.fixture(scope="session")
+def html_blobs():
+    """Every sample page as bytes, keyed by variant name or gold_category/silver_category."""
+    return MappingProxyType({
+        **_PRODUCT_PAGES,
+        'gold_category': _load("gold_category.html"),
+        'silver_category': _load("silver_category.html"),
+    })
+
+
+@pytest.fixture(scope="session")
+def response_registry(html_blobs):  # pylint: disable=redefined-outer-name
+    """URL path -> FakeResponse for every page the scrape_category tests fetch, built once per session."""
+    registry = {
+        '/zlatni-kyulcheta-investitsionni': FakeResponse(html_blobs['gold_category']),
+        '/srebro': FakeResponse(html_blobs['silver_category']),
+    }
+    # Product links listed on the sample category pages
+    for metal in ('gold', 'silver'):
+        product = FakeResponse(html_blobs[f'{metal}_product'])
+        for slug in ('coin-1', 'bar-1', 'coin-2'):
+            registry[f'/test-{metal}-{slug}'] = product
+    return MappingProxyType(registry)
+
+
+@pytest.fixture
+def registered_responses(mock_scraper_session, response_registry):  # pylint: disable=redefined-outer-name
+    """Serve mock session GETs from response_registry; unregistered URLs fail the fetch."""
+    mock_scraper_session.get = lambda url, **_: response_registry[urlsplit(url).path]
+    return response_registry
+
+
+@pytest.fixture(params=list(_VARIANTS))
+def sample_product_page(request):
+    """Each sample product page in turn, as a (metal_type, html_bytes) pair."""
+    return _VARIANTS[request.param]['metal'], _PRODUCT_PAGES[request.param]
+
+
+@pytest.fixture(scope="session")
+def sample_gold_product_coin(html_blobs) -> bytes:  # pylint: disable=redefined-outer-name
+    """Minimal HTML for a gold coin product - matches XPath structure."""
+    return html_blobs['gold_coin']
+
+
+@pytest.fixture(scope="session")
+def sample_gold_product_bar(html_blobs) -> bytes:  # pylint: disable=redefined-outer-name
+    """Minimal HTML for a gold bar product - matches XPath structure."""
+    return html_blobs['gold_bar']
+
+
+@pytest.fixture(scope="session")
+def sample_gold_product_html(html_blobs) -> bytes:  # pylint: disable=redefined-outer-name
+    """Alias for sample_gold_product_coin for backward compatibility."""
+    return html_blobs['gold_product']
+
+
+@pytest.fixture(scope="session")
+def sample_silver_product_coin(html_blobs) -> bytes:  # pylint: disable=redefined-outer-name
+    """Minimal HTML for a silver coin product - matches XPath structure."""
+    return html_blobs['silver_coin']
+
+
+@pytest.fixture(scope="session")
+def sample_silver_product_bar(html_blobs) -> bytes:  # pylint: disable=redefined-outer-name
+    """Minimal HTML for a silver bar product - matches XPath structure."""
+    return html_blobs['silver_bar']
+
+
+@pytest.fixture(scope="session")
+def sample_silver_product_html(html_blobs) -> bytes:  # pylint: disable=redefined-outer-name
+    """Alias for sample_silver_product_coin for backward compatibility."""
+    return html_blobs['silver_product']
+
+
+@pytest.fixture(scope="session")
+def ok_response():
+    """A 200 OK response carrying the gold coin sample page."""
+    return FakeResponse(content=_PRODUCT_PAGES['gold_coin'])
+
+
+@pytest.fixture(scope="session")
+def http_404_response():
+    """A 404 response whose raise_for_status raises HTTPError."""
+    def raise_for_status():
+        raise requests.HTTPError(response=response)
+
+    response = SimpleNamespace(status_code=404, content=b"<html></html>", raise_for_status=raise_for_status)
+    return response
+
+
+@pytest.fixture(scope="session")
+def sample_gold_category_html(html_blobs) -> bytes:  # pylint: disable=redefined-outer-name
+    """Minimal HTML for a gold category page - matches XPath structure."""
+    return html_blobs['gold_category']
+
+
+@pytest.fixture(scope="session")
+def sample_silver_category_html(html_blobs) -> bytes:  # pylint: disable=redefined-outer-name
+    """Minimal HTML for a silver category page - matches XPath structure."""
+    return html_blobs['silver_category']
@@ -1,6 +1,9 @@
 """Unit tests for BaseScraper class."""
+import random
+from dataclasses import replace
 from unittest.mock import Mock
 
+import pytest
 import requests
 
 from src.igold_scraper.scrapers.base import BaseScraper, Product, ScraperConfig
@@ -37,33 +40,77 @@ class ConcreteScraper(BaseScraper):
         return None
 
 
+def _scrape_category(scraper):
+    """Scrape one coin category page."""
+    return scraper.scrape_category("https://example.com/category", metal_type="gold", product_type_hint="coin")
+
+
+def _scrape_all(scraper):
+    """Scrape one coin and one bar category page."""
+    return scraper.scrape_all(
+        {"coin": ["https://example.com/coins"], "bar": ["https://example.com/bars"]}, metal_type="gold"
+    )
+
+
+@pytest.fixture(scope="class")
+def _class_scraper(build_scraper):
+    """Build one ConcreteScraper per test class around the shared mock session."""
+    return build_scraper(ConcreteScraper)
+
+
+@pytest.fixture
+def scraper(_class_scraper, mock_scraper_session):  # pylint: disable=unused-argument
+    """Provide the shared ConcreteScraper, clearing its per-test state afterwards."""
+    yield _class_scraper
+    _class_scraper.failed_urls.clear()
+
+
+@pytest.fixture(scope="session")
+def base_product():
+    """Gold coin Product that tests copy with dataclasses.replace."""
+    return Product(
+        name="Base",
+        url="https://example.com/x",
+        metal_type="gold",
+        product_type="coin",
+        weight=31.1,
+        purity=999,
+        sell_price_eur=100.0,
+        buy_price_eur=90.0,
+    )
+
+
+@pytest.mark.usefixtures("mock_time_sleep")
 class TestBaseScraper:
     """Tests for BaseScraper base functionality."""
 
-    def test_init_creates_session(self, mock_scraper_session):  # pylint: disable=unused-argument
+    def test_init_creates_session(self, scraper, mock_scraper_session):
         """Test that initialization creates a session."""
-        scraper = ConcreteScraper()
-        assert scraper.session is not None
+        assert scraper.session is mock_scraper_session
         assert not scraper.failed_urls
 
-    def test_fetch_page_success(self, mock_scraper_session):
+    @pytest.mark.retry_adapter
+    def test_init_mounts_retry_adapter(self, mock_scraper_session):
+        """Test that initialization mounts the retry adapter for both schemes."""
+        ConcreteScraper()
+
+        mounted = {c.args[0]: c.args[1] for c in mock_scraper_session.mount.call_args_list}
+        assert set(mounted) == {"http://", "https://"}
+        assert mounted["https://"].max_retries.total == 3
+
+    def test_fetch_page_success(self, scraper, mock_scraper_session, ok_response):
         """Test successful page fetch."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = b"<html>Test</html>"
-        mock_scraper_session.get = Mock(return_value=mock_response)
+        mock_scraper_session.get.return_value = ok_response
 
-        scraper = ConcreteScraper()
         response = scraper._fetch_page("https://example.com/test")  # pylint: disable=protected-access
 
-        assert response is not None
+        assert response is ok_response
         assert response.status_code == 200
 
-    def test_fetch_page_timeout(self, mock_scraper_session):
+    def test_fetch_page_timeout(self, scraper, mock_scraper_session):
         """Test handling of timeout errors."""
         mock_scraper_session.get = Mock(side_effect=requests.Timeout())
 
-        scraper = ConcreteScraper()
         response = scraper._fetch_page("https://example.com/test")  # pylint: disable=protected-access
 
         assert response is None
@@ -71,126 +118,57 @@ class TestBaseScraper:
         assert scraper.failed_urls[0][0] == "https://example.com/test"
         assert "Timeout" in scraper.failed_urls[0][1]
 
-    def test_fetch_page_http_error(self, mock_scraper_session):
+    def test_fetch_page_http_error(self, scraper, mock_scraper_session, http_404_response):
         """Test handling of HTTP errors."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.raise_for_status = Mock(
-            side_effect=requests.HTTPError(response=mock_response)
-        )
-        mock_scraper_session.get = Mock(return_value=mock_response)
+        mock_scraper_session.get.return_value = http_404_response
 
-        scraper = ConcreteScraper()
         response = scraper._fetch_page("https://example.com/test")  # pylint: disable=protected-access
 
         assert response is None
         assert len(scraper.failed_urls) == 1
         assert "HTTP 404" in scraper.failed_urls[0][1]
 
-    def test_fetch_page_general_exception(self, mock_scraper_session):
+    def test_fetch_page_general_exception(self, scraper, mock_scraper_session):
         """Test handling of general exceptions."""
         mock_scraper_session.get = Mock(side_effect=Exception("Network error"))
 
-        scraper = ConcreteScraper()
         response = scraper._fetch_page("https://example.com/test")  # pylint: disable=protected-access
 
         assert response is None
         assert len(scraper.failed_urls) == 1
         assert "Network error" in scraper.failed_urls[0][1]
 
-    def test_scrape_category(self, mock_scraper_session):
-        """Test scraping a category page."""
-        # Mock successful responses
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = b"<html>Test</html>"
-        mock_scraper_session.get = Mock(return_value=mock_response)
-
-        scraper = ConcreteScraper()
-        products = scraper.scrape_category(
-            "https://example.com/category",
-            metal_type="gold",
-            product_type_hint="coin"
-        )
-
-        assert len(products) == 2
-        assert all(p.metal_type == "gold" for p in products)
-        assert all(p.product_type == "coin" for p in products)
-
-    def test_scrape_category_no_products(self, mock_scraper_session):
-        """Test scraping category with no products."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_scraper_session.get = Mock(return_value=mock_response)
-
-        scraper = ConcreteScraper()
-        # Override gather_product_links to return empty list
-        scraper.gather_product_links = Mock(return_value=[])
-
-        products = scraper.scrape_category(
-            "https://example.com/category",
-            metal_type="gold"
-        )
-
-        assert len(products) == 0
-
-    def test_scrape_all(self, mock_scraper_session):
-        """Test scraping all categories."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = b"<html>Test</html>"
-        mock_scraper_session.get = Mock(return_value=mock_response)
-
-        scraper = ConcreteScraper()
-        category_urls = {
-            "coin": ["https://example.com/coins"],
-            "bar": ["https://example.com/bars"]
-        }
-
-        products = scraper.scrape_all(category_urls, metal_type="gold")
-
-        # Should have 2 products from each category (4 total)
-        assert len(products) == 4
+    @pytest.mark.parametrize(
+        "scrape,override_links,expected,expect_type",
+        [
+            (_scrape_category, None, 2, True),
+            (_scrape_category, [], 0, True),
+            (_scrape_all, None, 4, False),
+        ],
+        ids=["category", "category_no_products", "all"],
+    )
+    def test_scrape(
+        self, scraper, mock_scraper_session, ok_response, monkeypatch, scrape, override_links, expected, expect_type
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """Test scraping a category page, an empty category and all categories."""
+        mock_scraper_session.get.return_value = ok_response
+        if override_links is not None:
+            monkeypatch.setattr(scraper, "gather_product_links", Mock(return_value=override_links))
+
+        products = scrape(scraper)
+
+        # ConcreteScraper yields 2 products per category page unless gather_product_links is overridden
+        assert len(products) == expected
         assert all(p.metal_type == "gold" for p in products)
+        if expect_type:
+            assert all(p.product_type == "coin" for p in products)
 
-    def test_sort_products(self, mock_scraper_session):  # pylint: disable=unused-argument
+    def test_sort_products(self, scraper, base_product):
         """Test sorting products by price per gram."""
-        scraper = ConcreteScraper()
-
         products = [
-            Product(
-                name="Expensive",
-                url="https://example.com/expensive",
-                metal_type="gold",
-                product_type="coin",
-                weight=31.1,
-                purity=999,
-                sell_price_eur=100.0,
-                buy_price_eur=90.0,
-                price_per_g_fine_eur=3.2
-            ),
-            Product(
-                name="No Price",
-                url="https://example.com/noprice",
-                metal_type="gold",
-                product_type="coin",
-                weight=31.1,
-                purity=999,
-                sell_price_eur=100.0,
-                buy_price_eur=90.0,
-                price_per_g_fine_eur=None
-            ),
-            Product(
-                name="Cheap",
-                url="https://example.com/cheap",
-                metal_type="gold",
-                product_type="coin",
-                weight=31.1,
-                purity=999,
-                sell_price_eur=80.0,
-                buy_price_eur=70.0,
-                price_per_g_fine_eur=2.5
-            ),
+            replace(base_product, name="Expensive", price_per_g_fine_eur=3.2),
+            replace(base_product, name="No Price", price_per_g_fine_eur=None),
+            replace(base_product, name="Cheap", sell_price_eur=80.0, buy_price_eur=70.0, price_per_g_fine_eur=2.5),
         ]
 
         sorted_products = scraper.sort_products(products)
@@ -200,22 +178,42 @@ class TestBaseScraper:
         assert sorted_products[1].name == "Expensive"
         assert sorted_products[2].name == "No Price"
 
-    def test_cleanup_closes_session(self, mock_scraper_session):
+    def test_cleanup_closes_session(self, scraper, mock_scraper_session):
         """Test cleanup closes the session."""
-        scraper = ConcreteScraper()
         scraper.cleanup()
 
         mock_scraper_session.close.assert_called_once()
 
-    def test_context_manager(self, mock_scraper_session):
+    def test_context_manager(self, scraper, mock_scraper_session):
         """Test using scraper as context manager."""
-        with ConcreteScraper() as scraper:
-            assert scraper is not None
+        with scraper as entered:
+            assert entered is scraper
 
         # Session should be closed after exiting context
         mock_scraper_session.close.assert_called_once()
 
 
+@pytest.fixture(scope="module")
+def config_1_to_2():
+    """ScraperConfig with a 1.0-2.0 second delay range."""
+    return ScraperConfig(base_url="https://example.com", delay_min=1.0, delay_max=2.0)
+
+
+@pytest.fixture
+def sample_product():
+    """Gold coin Product shared by the Product tests."""
+    return Product(
+        name="Test Coin",
+        url="https://example.com/coin",
+        metal_type="gold",
+        product_type="coin",
+        weight=31.1,
+        purity=999,
+        sell_price_eur=100.0,
+        buy_price_eur=90.0
+    )
+
+
 class TestScraperConfig:
     """Tests for ScraperConfig."""
 
@@ -247,30 +245,21 @@ class TestScraperConfig:
         assert config.retry_attempts == 5
         assert config.retry_backoff == 2.0
 
-    def test_get_random_delay(self):
+    def test_get_random_delay(self, config_1_to_2, monkeypatch):
         """Test random delay is within bounds."""
-        config = ScraperConfig(base_url="https://example.com", delay_min=1.0, delay_max=2.0)
+        # Seeded private generator keeps the samples deterministic without touching the global random state
+        monkeypatch.setattr(random, "uniform", random.Random(0).uniform)
+        samples = [config_1_to_2.get_random_delay() for _ in range(10)]
 
-        for _ in range(10):
-            delay = config.get_random_delay()
-            assert 1.0 <= delay <= 2.0
+        assert min(samples) >= 1.0 and max(samples) <= 2.0
 
 
 class TestProduct:
     """Tests for Product dataclass."""
 
-    def test_product_creation(self):
+    def test_product_creation(self, sample_product):
         """Test creating a Product instance."""
-        product = Product(
-            name="Test Coin",
-            url="https://example.com/coin",
-            metal_type="gold",
-            product_type="coin",
-            weight=31.1,
-            purity=999,
-            sell_price_eur=100.0,
-            buy_price_eur=90.0
-        )
+        product = sample_product
 
         assert product.name == "Test Coin"
         assert product.url == "https://example.com/coin"
@@ -281,23 +270,14 @@ class TestProduct:
         assert product.sell_price_eur == 100.0
         assert product.buy_price_eur == 90.0
 
-    def test_product_to_dict(self):
+    def test_product_to_dict(self, sample_product):
         """Test converting Product to dictionary."""
-        product = Product(
-            name="Test Coin",
-            url="https://example.com/coin",
-            metal_type="gold",
-            product_type="coin",
-            weight=31.1,
-            purity=999,
-            sell_price_eur=100.0,
-            buy_price_eur=90.0
-        )
-
-        product_dict = product.to_dict()
+        expected = {
+            "product_name": "Test Coin",
+            "url": "https://example.com/coin",
+            "metal_type": "gold",
+            "product_type": "coin",
+            "total_weight_g": 31.1,
+        }
 
-        assert product_dict["product_name"] == "Test Coin"
-        assert product_dict["url"] == "https://example.com/coin"
-        assert product_dict["metal_type"] == "gold"
-        assert product_dict["product_type"] == "coin"
-        assert product_dict["total_weight_g"] == 31.1
+        assert expected.items() <= sample_product.to_dict().items()
@@ -0,0 +1,53 @@
+"""Unit tests for extracting product pages with the gold and silver scrapers."""
+import pytest
+
+from src.igold_scraper.scrapers.gold import IgoldGoldScraper
+from src.igold_scraper.scrapers.silver import IgoldSilverScraper
+
+pytestmark = pytest.mark.usefixtures("mock_time_sleep")
+
+
+class TestExtractValidProduct:  # pylint: disable=too-few-public-methods
+    """Tests for extract_product_data on each valid sample page."""
+
+    @pytest.mark.parametrize(
+        "fixture,cls,name_part,expected",
+        [
+            (
+                "sample_gold_product_html", IgoldGoldScraper, "3.99",
+                {"product_type": "coin", "sell_price_eur": 486.75, "buy_price_eur": 466.81},
+            ),
+            (
+                "sample_gold_product_bar", IgoldGoldScraper, "Кюлче",
+                {
+                    "product_type": "bar", "sell_price_eur": 1277.95, "buy_price_eur": 1226.61,
+                    "weight": 10.0, "purity": 999.9, "fine_metal": 10.0,
+                },
+            ),
+            (
+                "sample_silver_product_html", IgoldSilverScraper, "31.1",
+                {"sell_price_eur": 38.62, "buy_price_eur": 30.68},
+            ),
+            (
+                "sample_silver_product_bar", IgoldSilverScraper, "Кюлче",
+                {
+                    "product_type": "bar", "sell_price_eur": 281.19, "buy_price_eur": 255.62,
+                    "weight": 100.0, "purity": 999.9, "fine_metal": 100.0,
+                },
+            ),
+        ],
+        ids=["gold_coin", "gold_bar", "silver_coin", "silver_bar"],
+    )
+    def test_extract_valid_product(
+        self, request, scrapers, fake_response, mock_scraper_session, fixture, cls, name_part, expected
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """Test extracting name, type, prices and weights from a valid product page."""
+        page = request.getfixturevalue(fixture)
+        response = fake_response(content=page)
+        mock_scraper_session.get = lambda url, **_: response
+
+        result = scrapers[cls].extract_product_data('https://igold.bg/product/sample')
+
+        assert result
+        assert name_part in result.name
+        assert {field: getattr(result, field) for field in expected} == expected
@@ -0,0 +1,42 @@
+"""Unit tests for the shared igold.bg scraper logic."""
+import pytest
+from lxml import etree
+
+from src.igold_scraper.constants import xpaths
+from src.igold_scraper.scrapers import igold_base
+from src.igold_scraper.scrapers.igold_base import IgoldBaseScraper
+
+pytestmark = pytest.mark.usefixtures("mock_time_sleep")
+
+
+class TestSampleProductPages:  # pylint: disable=too-few-public-methods
+    """Tests run against every sample product page."""
+
+    def test_extract_sample_page(self, fake_response, sample_product_page, mock_scraper_session):
+        """Test that each sample page yields a complete, valid product."""
+        metal_type, page = sample_product_page
+        mock_response = fake_response(content=page, status_code=200)
+        mock_scraper_session.get = lambda url, **_: mock_response
+
+        scraper = IgoldBaseScraper(metal_type=metal_type)
+
+        result = scraper.extract_product_data('https://igold.bg/product/sample')
+
+        assert result is not None
+        assert result.is_valid
+        assert result.metal_type == metal_type
+        assert result.product_type in ('coin', 'bar')
+        assert result.fine_metal > 0
+        assert result.price_per_g_fine_eur > 0
+
+
+class TestCompiledXPaths:  # pylint: disable=too-few-public-methods
+    """Tests for the module-level compiled XPath selectors."""
+
+    @pytest.mark.parametrize("name", ["PRODUCT_TITLE", "PRICE_SELL_EUR", "PRICE_BUY_EUR", "CATEGORY_PRODUCT_LINKS"])
+    def test_selector_is_compiled_once(self, name):
+        """Test that each selector is an etree.XPath built from its xpaths constant."""
+        compiled = getattr(igold_base, f"_XPATH_{name}")
+
+        assert isinstance(compiled, etree.XPath)
+        assert compiled.path == getattr(xpaths, name)
@@ -0,0 +1,48 @@
+"""Property-based tests for the spread and price-per-gram math in scraped products."""
+import pytest
+from hypothesis import HealthCheck, given, settings
+from hypothesis import strategies as st
+
+from src.igold_scraper.scrapers.gold import IgoldGoldScraper
+from src.igold_scraper.scrapers.silver import IgoldSilverScraper
+
+pytestmark = pytest.mark.usefixtures("mock_time_sleep")
+
+
+@st.composite
+def _prices(draw):
+    """Sell/buy prices in whole cents with buy <= sell, plus a weight in tenths of a gram."""
+    sell_cents = draw(st.integers(1_000, 1_000_000))
+    buy_cents = draw(st.integers(500, sell_cents))
+    weight_tenths = draw(st.integers(1, 10_000))
+    return sell_cents / 100, buy_cents / 100, weight_tenths / 10
+
+
+class TestPriceMath:  # pylint: disable=too-few-public-methods
+    """Invariants between the parsed prices, spread and price per gram."""
+
+    @pytest.mark.parametrize(
+        "metal,cls", [("gold", IgoldGoldScraper), ("silver", IgoldSilverScraper)], ids=["gold", "silver"]
+    )
+    @settings(max_examples=25, derandomize=True, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    @given(prices=_prices())
+    def test_spread_and_price_per_gram(
+        self, scrapers, fake_response, render_product_page, mock_scraper_session, metal, cls, prices
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """Test that spread and price per gram follow from the scraped sell/buy prices and weight."""
+        sell, buy, weight = prices
+        page = render_product_page(
+            metal,
+            title='Property Test', heading=f'{weight} гр. Монета Тест',
+            sell_eur=f'{sell:.2f}', sell_bgn='0.00', buy_eur=f'{buy:.2f}', buy_bgn='0.00',
+            weight=weight, purity='999', fine_weight=weight,
+        )
+        response = fake_response(content=page)
+        mock_scraper_session.get = lambda url, **_: response
+
+        result = scrapers[cls].extract_product_data('https://igold.bg/product/property-test')
+
+        assert result.sell_price_eur == sell
+        assert result.buy_price_eur == buy
+        assert result.spread_percentage == pytest.approx((sell - buy) / sell * 100, abs=0.005)
+        assert result.price_per_g_fine_eur == pytest.approx(sell / weight, abs=0.005)
@@ -0,0 +1,71 @@
+"""Unit tests for the tavex.bg gold scraper."""
+import pytest
+import requests
+
+from igold_scraper.scrapers import tavex
+
+_ZLATO_URL = tavex.config.TAVEX_BASE_URL + "/zlato/"
+
+_MODAL_BODY = '''<body>
+<div id="modaal-add-price-alert"><select>
+<option value="">Изберете продукт</option>
+<option data-pricelist='{"buy": [{"price": "950.00"}], "sell": [{"price": "1000.00"}]}'>
+  Златно кюлче 10 гр.
+</option>
+<option data-pricelist='{"buy": [{"price": "300.50"}], "sell": [{"price": "320.00"}]}'>Златна монета</option>
+<option data-pricelist='{"buy": [{"price": "1.00"}], "sell": []}'>Без продажна цена</option>
+<option data-pricelist='not json'>Повредени данни</option>
+<option data-pricelist='{"buy": [{"amount": 1}], "sell": [{"price": "2.00"}]}'>Без ключ price</option>
+</select></div>
+</body>'''
+
+_EXPECTED_PRODUCTS = [
+    {"name": "Златно кюлче 10 гр.", "buy_price": 950.0, "sell_price": 1000.0, "spread_percentage": 5.0},
+    {"name": "Златна монета", "buy_price": 300.5, "sell_price": 320.0, "spread_percentage": 6.09},
+]
+
+
+def _html_response(content: bytes, content_type: str = "text/html") -> requests.Response:
+    """Build a real requests.Response so encoding follows requests' own header handling."""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = content_type
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response._content = content  # pylint: disable=protected-access
+    return response
+
+
+class TestScrapeTavexGoldProducts:
+    """Tests for scrape_tavex_gold_products."""
+
+    @pytest.mark.parametrize(
+        "content,content_type",
+        [
+            (f'<html><head><meta charset="utf-8"></head>{_MODAL_BODY}</html>'.encode("utf-8"), "text/html"),
+            (f"<html>{_MODAL_BODY}</html>".encode("utf-8"), "text/html"),
+            (f"<html>{_MODAL_BODY}</html>".encode("cp1251"), "text/html; charset=windows-1251"),
+        ],
+        ids=["meta_charset", "no_charset", "header_charset"],
+    )
+    def test_parses_modal_options(self, http_responses, content, content_type):
+        """Test extracting names and data-pricelist prices, skipping incomplete or malformed options."""
+        http_responses[_ZLATO_URL] = _html_response(content, content_type)
+
+        assert tavex.scrape_tavex_gold_products() == _EXPECTED_PRODUCTS
+
+    @pytest.mark.parametrize(
+        "content",
+        [b"", b"  \n", b"<html><body><p>No modal here</p></body></html>"],
+        ids=["empty", "whitespace", "no_modal"],
+    )
+    def test_returns_empty_list_without_modal(self, http_responses, content):
+        """Test that an empty body or a page without the modal yields no products."""
+        http_responses[_ZLATO_URL] = _html_response(content)
+
+        assert not tavex.scrape_tavex_gold_products()
+
+    def test_returns_empty_list_on_network_error(self, http_responses):
+        """Test that a failed request yields no products."""
+        http_responses[_ZLATO_URL] = requests.ConnectionError
+
+        assert not tavex.scrape_tavex_gold_products()
@@ -1,19 +1,42 @@
 """Unit tests for data_manager service."""
 
-import json
-from datetime import datetime, timedelta
+from datetime import datetime
+from pathlib import Path
+
+import orjson
+import pytest
+import time_machine
 
 from igold_scraper.services.data_manager import csv_to_json, organize_daily_data, cleanup_old_data
 
+# Frozen clock for the cleanup tests; noon keeps the local date stable across timezones
+_NOW = datetime(2025, 6, 1, 12, 0)
+_TODAY = "2025-06-01"
+_BORDERLINE = "2024-12-04"  # 179 days before _TODAY, just inside the 180-day window
+_OLD = "2024-11-01"  # 7 months
+_VERY_OLD = "2024-06-01"  # 1 year
+
+_EMPTY_JSON = b"{}"
+_TEST_PAYLOAD = b'{"test": "data"}'
+
+
+@pytest.fixture
+def data_dirs(fs):
+    """Create the data/gold and data/silver skeleton on the fake filesystem."""
+    gold_dir, silver_dir = Path("data/gold"), Path("data/silver")
+    fs.create_dir(gold_dir)
+    fs.create_dir(silver_dir)
+    return gold_dir, silver_dir
+
 
 class TestCsvToJson:
     """Test CSV to JSON conversion."""
 
-    def test_csv_to_json_valid_file(self, tmp_path):
+    def test_csv_to_json_valid_file(self, fs):
         """Test converting valid CSV file to JSON."""
-        csv_file = tmp_path / "test.csv"
+        csv_file = Path("/test.csv")
         csv_content = "product_name;price_eur;quantity\n" "Gold Bar;1000.50;5\n" "Silver Coin;25.99;10\n"
-        csv_file.write_text(csv_content)
+        fs.create_file(csv_file, contents=csv_content)
 
         result = csv_to_json(str(csv_file))
 
@@ -24,11 +47,11 @@ class TestCsvToJson:
         assert result[0]["quantity"] == 5
         assert result[1]["product_name"] == "Silver Coin"
 
-    def test_csv_to_json_type_conversion(self, tmp_path):
+    def test_csv_to_json_type_conversion(self, fs):
         """Test that types are properly converted."""
-        csv_file = tmp_path / "test.csv"
+        csv_file = Path("/test.csv")
         csv_content = "product_name;price_eur;in_stock\n" "Item1;123.45;true\n" "Item2;67.89;false\n"
-        csv_file.write_text(csv_content)
+        fs.create_file(csv_file, contents=csv_content)
 
         result = csv_to_json(str(csv_file))
 
@@ -40,10 +63,10 @@ class TestCsvToJson:
         assert result[0]["in_stock"] == "true"
         assert result[1]["in_stock"] == "false"
 
-    def test_csv_to_json_empty_file(self, tmp_path):
+    def test_csv_to_json_empty_file(self, fs):
         """Test handling empty CSV file."""
-        csv_file = tmp_path / "empty.csv"
-        csv_file.write_text("name,price\n")
+        csv_file = Path("/empty.csv")
+        fs.create_file(csv_file, contents="name,price\n")
 
         result = csv_to_json(str(csv_file))
 
@@ -55,11 +78,11 @@ class TestCsvToJson:
 
         assert result is None
 
-    def test_csv_to_json_invalid_encoding(self, tmp_path):
+    def test_csv_to_json_invalid_encoding(self, fs):
         """Test handling file with encoding issues."""
-        csv_file = tmp_path / "invalid.csv"
+        csv_file = Path("/invalid.csv")
         # Write invalid UTF-8 bytes
-        csv_file.write_bytes(b"name,price\n\xff\xfe")
+        fs.create_file(csv_file, contents=b"name,price\n\xff\xfe")
 
         result = csv_to_json(str(csv_file))
 
@@ -69,19 +92,13 @@ class TestCsvToJson:
 class TestOrganizeDailyData:
     """Test organizing daily data."""
 
-    def test_organize_gold_files(self, tmp_path, monkeypatch):
+    @pytest.mark.usefixtures("data_dirs")
+    def test_organize_gold_files(self, fs):
         """Test organizing gold CSV files with actual file operations."""
-        # Set up working directory
-        monkeypatch.chdir(tmp_path)
-
-        # Create data directories
-        (tmp_path / "data" / "gold").mkdir(parents=True)
-        (tmp_path / "data" / "silver").mkdir(parents=True)
-
         # Create a CSV file
-        csv_file = tmp_path / "igold_gold_products_sorted_2025-01-13.csv"
+        csv_file = Path("igold_gold_products_sorted_2025-01-13.csv")
         csv_content = "product_name;price_eur;weight\n" "Gold Bar;1000.50;31.1\n"
-        csv_file.write_text(csv_content)
+        fs.create_file(csv_file, contents=csv_content)
 
         organize_daily_data()
 
@@ -90,12 +107,11 @@ class TestOrganizeDailyData:
 
         # Verify JSON file was created
         today = datetime.now().strftime("%Y-%m-%d")
-        json_file = tmp_path / "data" / "gold" / f"{today}.json"
+        json_file = Path("data") / "gold" / f"{today}.json"
         assert json_file.exists()
 
         # Verify JSON structure and content
-        with open(json_file, encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(json_file.read_bytes())
 
         assert data["date"] == today
         assert data["source"] == "igold.bg"
@@ -104,47 +120,41 @@ class TestOrganizeDailyData:
         assert data["products"][0]["product_name"] == "Gold Bar"
         assert data["products"][0]["price_eur"] == 1000.50
 
-    def test_organize_silver_files(self, tmp_path, monkeypatch):
+    @pytest.mark.usefixtures("data_dirs")
+    def test_organize_silver_files(self, fs):
         """Test organizing silver CSV files."""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / "data" / "silver").mkdir(parents=True)
 
-        csv_file = tmp_path / "igold_silver_products_sorted_2025-01-13.csv"
+        csv_file = Path("igold_silver_products_sorted_2025-01-13.csv")
         csv_content = "product_name;price_eur\nSilver Coin;25.99\n"
-        csv_file.write_text(csv_content)
+        fs.create_file(csv_file, contents=csv_content)
 
         organize_daily_data()
 
         assert not csv_file.exists()
         today = datetime.now().strftime("%Y-%m-%d")
-        json_file = tmp_path / "data" / "silver" / f"{today}.json"
+        json_file = Path("data") / "silver" / f"{today}.json"
         assert json_file.exists()
 
-        with open(json_file, encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(json_file.read_bytes())
         assert data["product_type"] == "silver"
 
-    def test_organize_no_files(self, tmp_path, monkeypatch):
+    @pytest.mark.usefixtures("data_dirs")
+    def test_organize_no_files(self):
         """Test when no CSV files exist."""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / "data" / "gold").mkdir(parents=True)
-
         # Should not raise exception
         organize_daily_data()
 
         # No JSON files should be created
         today = datetime.now().strftime("%Y-%m-%d")
-        json_file = tmp_path / "data" / "gold" / f"{today}.json"
+        json_file = Path("data") / "gold" / f"{today}.json"
         assert not json_file.exists()
 
-    def test_organize_invalid_csv(self, tmp_path, monkeypatch):
+    @pytest.mark.usefixtures("data_dirs")
+    def test_organize_invalid_csv(self, fs):
         """Test handling invalid CSV data."""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / "data" / "gold").mkdir(parents=True)
-
         # Create invalid CSV (will fail conversion)
-        csv_file = tmp_path / "igold_gold_products_sorted_2025-01-13.csv"
-        csv_file.write_bytes(b"invalid\xff\xfe")
+        csv_file = Path("igold_gold_products_sorted_2025-01-13.csv")
+        fs.create_file(csv_file, contents=b"invalid\xff\xfe")
 
         # Should not raise exception
         organize_daily_data()
@@ -156,28 +166,22 @@ class TestOrganizeDailyData:
 class TestCleanupOldData:
     """Test cleaning up old data files."""
 
-    def test_cleanup_removes_old_files(self, tmp_path, monkeypatch):
-        """Test that old files are removed."""
-        monkeypatch.chdir(tmp_path)
-
-        # Create data directories
-        gold_dir = tmp_path / "data" / "gold"
-        silver_dir = tmp_path / "data" / "silver"
-        gold_dir.mkdir(parents=True)
-        silver_dir.mkdir(parents=True)
-
-        # Create old (7 months ago) and recent files
-        old_date = (datetime.now() - timedelta(days=210)).strftime("%Y-%m-%d")
-        recent_date = datetime.now().strftime("%Y-%m-%d")
+    @pytest.fixture(autouse=True)
+    def _frozen_clock(self):
+        """Pin datetime.now() to _NOW so the six-month cutoff is fixed."""
+        with time_machine.travel(_NOW, tick=False):
+            yield
 
-        old_gold_file = gold_dir / f"{old_date}.json"
-        recent_gold_file = gold_dir / f"{recent_date}.json"
-        old_silver_file = silver_dir / f"{old_date}.json"
-        recent_silver_file = silver_dir / f"{recent_date}.json"
+    def test_cleanup_removes_old_files(self, data_dirs):
+        """Test that old files are removed."""
+        gold_dir, silver_dir = data_dirs
+        old_gold_file = gold_dir / f"{_OLD}.json"
+        recent_gold_file = gold_dir / f"{_TODAY}.json"
+        old_silver_file = silver_dir / f"{_OLD}.json"
+        recent_silver_file = silver_dir / f"{_TODAY}.json"
 
-        # Write some data to files
         for file in [old_gold_file, recent_gold_file, old_silver_file, recent_silver_file]:
-            file.write_text('{"test": "data"}')
+            file.write_bytes(_TEST_PAYLOAD)
 
         cleanup_old_data()
 
@@ -189,33 +193,21 @@ class TestCleanupOldData:
         assert recent_gold_file.exists()
         assert recent_silver_file.exists()
 
-    def test_cleanup_no_directories(self, tmp_path, monkeypatch):
+    def test_cleanup_no_directories(self, fs):  # pylint: disable=unused-argument
         """Test when data directories don't exist."""
-        monkeypatch.chdir(tmp_path)
-
         # Should not raise exception
         cleanup_old_data()
 
-    def test_cleanup_only_old_files(self, tmp_path, monkeypatch):
+    def test_cleanup_only_old_files(self, data_dirs):
         """Test cleanup removes only files older than 6 months."""
-        monkeypatch.chdir(tmp_path)
-
-        gold_dir = tmp_path / "data" / "gold"
-        gold_dir.mkdir(parents=True)
-
-        # Create files at various ages
-        very_old = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")  # 1 year
-        old = (datetime.now() - timedelta(days=200)).strftime("%Y-%m-%d")  # 6.5 months
-        borderline = (datetime.now() - timedelta(days=179)).strftime("%Y-%m-%d")  # Just under 6 months
-        recent = datetime.now().strftime("%Y-%m-%d")
-
-        very_old_file = gold_dir / f"{very_old}.json"
-        old_file = gold_dir / f"{old}.json"
-        borderline_file = gold_dir / f"{borderline}.json"
-        recent_file = gold_dir / f"{recent}.json"
+        gold_dir, _ = data_dirs
+        very_old_file = gold_dir / f"{_VERY_OLD}.json"
+        old_file = gold_dir / f"{_OLD}.json"
+        borderline_file = gold_dir / f"{_BORDERLINE}.json"
+        recent_file = gold_dir / f"{_TODAY}.json"
 
         for file in [very_old_file, old_file, borderline_file, recent_file]:
-            file.write_text("{}")
+            file.write_bytes(_EMPTY_JSON)
 
         cleanup_old_data()
 
@@ -227,21 +219,13 @@ class TestCleanupOldData:
         assert borderline_file.exists()
         assert recent_file.exists()
 
-    def test_cleanup_keeps_recent_files(self, tmp_path, monkeypatch):
+    def test_cleanup_keeps_recent_files(self, data_dirs):
         """Test that recent files are not removed."""
-        monkeypatch.chdir(tmp_path)
-
-        gold_dir = tmp_path / "data" / "gold"
-        silver_dir = tmp_path / "data" / "silver"
-        gold_dir.mkdir(parents=True)
-        silver_dir.mkdir(parents=True)
-
-        recent_date = datetime.now().strftime("%Y-%m-%d")
-        gold_file = gold_dir / f"{recent_date}.json"
-        silver_file = silver_dir / f"{recent_date}.json"
-
-        gold_file.write_text("{}")
-        silver_file.write_text("{}")
+        gold_dir, silver_dir = data_dirs
+        gold_file = gold_dir / f"{_TODAY}.json"
+        silver_file = silver_dir / f"{_TODAY}.json"
+        gold_file.write_bytes(_EMPTY_JSON)
+        silver_file.write_bytes(_EMPTY_JSON)
 
         cleanup_old_data()
 
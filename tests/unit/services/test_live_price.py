@@ -1,15 +1,91 @@
 """Unit tests for live_price service."""
 
-import json
+import copy
+import math
 import os
-from unittest.mock import Mock, patch
+from pathlib import Path
+from unittest.mock import patch
 
+import orjson
 import pytest
 import requests
 
 from igold_scraper.services.live_price import LivePriceFetcher
 from igold_scraper.exceptions import ConfigurationError, NetworkError, ValidationError
 
+# Relative like DEFAULT_DATA_DIR, so it resolves against the fake filesystem's working directory
+_GOLD_PRICE_DIR = Path("data/live_prices/gold")
+
+# API payloads shared across tests; _Resp serializes them, so the fetcher never sees the shared objects
+_TS = 1704067200000  # Jan 1, 2024
+_GOLD_ELITE_PAYLOAD = (
+    {
+        "ts": _TS,
+        "spreadProfilePrices": (
+            {"spreadProfile": "elite", "bid": 2000.00, "ask": 2010.00, "bidSpread": 0.5},
+        ),
+    },
+)
+_SILVER_ELITE_PAYLOAD = (
+    {
+        "ts": _TS,
+        "spreadProfilePrices": (
+            {"spreadProfile": "elite", "bid": 24.00, "ask": 24.50, "bidSpread": 0.25},
+        ),
+    },
+)
+_GOLD_STANDARD_PAYLOAD = (
+    {
+        "ts": _TS,
+        "spreadProfilePrices": (
+            {"spreadProfile": "standard", "bid": 2000.00, "ask": 2015.00, "bidSpread": 0.75},
+        ),
+    },
+)
+# Bid/ask in EUR per troy ounce
+_GOLD_CALC_PAYLOAD = (
+    {
+        "ts": _TS,
+        "spreadProfilePrices": (
+            {"spreadProfile": "elite", "bid": 1861.00, "ask": 1863.00, "bidSpread": 0.5},
+        ),
+    },
+)
+
+
+def _api_url(metal):
+    """Return the URL the module fetcher requests for metal."""
+    return f"https://api.example.com/{metal}/EUR"
+
+
+class _Resp:  # pylint: disable=too-few-public-methods
+    """Minimal stand-in for requests.Response whose body is payload encoded as JSON."""
+
+    __slots__ = ("content", "raise_for_status")
+
+    def __init__(self, payload):
+        self.content = orjson.dumps(payload)
+        self.raise_for_status = lambda: None
+
+
+def _raiser(exc):
+    """Return a callable that raises exc, for stubbing a failing response method."""
+    def _raise(*_args, **_kwargs):
+        raise exc
+    return _raise
+
+
+@pytest.fixture(scope="module")
+def _base_fetcher():
+    """Construct one fetcher for the module; tests get a shallow copy of it."""
+    return LivePriceFetcher(api_base_url="https://api.example.com")
+
+
+@pytest.fixture
+def fetcher(_base_fetcher):
+    """Provide a per-test copy of the module fetcher."""
+    return copy.copy(_base_fetcher)
+
 
 class TestLivePriceFetcherInit:
     """Test LivePriceFetcher initialization."""
@@ -37,125 +113,74 @@ class TestLivePriceFetcherInit:
 class TestFetchLivePrice:
     """Test fetching live precious metals prices."""
 
-    def test_fetch_gold_price_success(self):
-        """Test successfully fetching gold price."""
-        fetcher = LivePriceFetcher(api_base_url="https://api.example.com")
-
-        mock_response = Mock()
-        mock_response.json.return_value = [
-            {
-                "ts": 1704067200000,  # Jan 1, 2024
-                "spreadProfilePrices": [{"spreadProfile": "elite", "bid": 2000.00, "ask": 2010.00, "bidSpread": 0.5}],
-            }
-        ]
-
-        with patch("requests.get", return_value=mock_response):
-            result = fetcher.fetch_live_price("XAU")
+    @pytest.mark.parametrize(
+        "metal,payload,expected_name,expected_bid,expected_ask",
+        [
+            ("XAU", _GOLD_ELITE_PAYLOAD, "gold", 2000.0, 2010.0),
+            ("XAG", _SILVER_ELITE_PAYLOAD, "silver", 24.0, 24.5),
+            ("XAU", _GOLD_STANDARD_PAYLOAD, "gold", 2000.0, 2015.0),
+        ],
+        ids=["gold", "silver", "no_elite_profile"],
+    )
+    def test_fetch_price_success(
+        self, fetcher, http_responses, metal, payload, expected_name, expected_bid, expected_ask
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """Test fetching a price, falling back to the first profile when elite is not available."""
+        http_responses[_api_url(metal)] = _Resp(payload)
+
+        result = fetcher.fetch_live_price(metal)
 
         assert result is not None
-        assert result["metal"] == "XAU"
-        assert result["metal_name"] == "gold"
-        assert "prices" in result
-        assert "eur_per_gram" in result["prices"]
+        assert result["metal"] == metal
+        assert result["metal_name"] == expected_name
+        assert result["prices"]["eur_per_oz"]["bid"] == expected_bid
+        assert result["prices"]["eur_per_oz"]["ask"] == expected_ask
         assert result["prices"]["eur_per_gram"]["mid"] > 0
 
-    def test_fetch_silver_price_success(self):
-        """Test successfully fetching silver price."""
-        fetcher = LivePriceFetcher(api_base_url="https://api.example.com")
-
-        mock_response = Mock()
-        mock_response.json.return_value = [
-            {
-                "ts": 1704067200000,
-                "spreadProfilePrices": [{"spreadProfile": "elite", "bid": 24.00, "ask": 24.50, "bidSpread": 0.25}],
-            }
-        ]
-
-        with patch("requests.get", return_value=mock_response):
-            result = fetcher.fetch_live_price("XAG")
-
-        assert result is not None
-        assert result["metal"] == "XAG"
-        assert result["metal_name"] == "silver"
-
-    def test_fetch_price_empty_response(self):
+    def test_fetch_price_empty_response(self, fetcher, http_responses):
         """Test handling empty API response."""
-        fetcher = LivePriceFetcher(api_base_url="https://api.example.com")
-
-        mock_response = Mock()
-        mock_response.json.return_value = []
-
-        with patch("requests.get", return_value=mock_response):
-            with pytest.raises(ValidationError, match="Empty response"):
-                fetcher.fetch_live_price("XAU")
-
-    def test_fetch_price_no_elite_profile(self):
-        """Test fallback when elite profile not available."""
-        fetcher = LivePriceFetcher(api_base_url="https://api.example.com")
+        http_responses[_api_url("XAU")] = _Resp([])
 
-        mock_response = Mock()
-        mock_response.json.return_value = [
-            {
-                "ts": 1704067200000,
-                "spreadProfilePrices": [
-                    {"spreadProfile": "standard", "bid": 2000.00, "ask": 2015.00, "bidSpread": 0.75}
-                ],
-            }
-        ]
+        with pytest.raises(ValidationError, match="Empty response"):
+            fetcher.fetch_live_price("XAU")
 
-        with patch("requests.get", return_value=mock_response):
-            result = fetcher.fetch_live_price("XAU")
+    def test_fetch_price_null_response(self, fetcher, http_responses):
+        """Test that a JSON null body is rejected like an empty response."""
+        http_responses[_api_url("XAU")] = _Resp(None)
 
-        assert result is not None
-        assert result["spread_profile"] == "standard"
+        with pytest.raises(ValidationError, match="Empty response"):
+            fetcher.fetch_live_price("XAU")
 
-    def test_fetch_price_request_timeout(self):
+    def test_fetch_price_request_timeout(self, fetcher, http_responses):
         """Test handling request timeout."""
-        fetcher = LivePriceFetcher(api_base_url="https://api.example.com")
+        http_responses[_api_url("XAU")] = requests.Timeout
 
-        with patch("requests.get", side_effect=requests.Timeout):
-            with pytest.raises(NetworkError, match="Failed to fetch"):
-                fetcher.fetch_live_price("XAU")
+        with pytest.raises(NetworkError, match="Failed to fetch"):
+            fetcher.fetch_live_price("XAU")
 
-    def test_fetch_price_http_error(self):
+    def test_fetch_price_http_error(self, fetcher, http_responses):
         """Test handling HTTP errors."""
-        fetcher = LivePriceFetcher(api_base_url="https://api.example.com")
-
-        mock_response = Mock()
-        mock_response.raise_for_status.side_effect = requests.HTTPError
-
-        with patch("requests.get", return_value=mock_response):
-            with pytest.raises(NetworkError, match="Failed to fetch"):
-                fetcher.fetch_live_price("XAU")
+        response = _Resp([])
+        response.raise_for_status = _raiser(requests.HTTPError)
+        http_responses[_api_url("XAU")] = response
 
-    def test_fetch_price_invalid_json(self):
-        """Test handling invalid JSON response."""
-        fetcher = LivePriceFetcher(api_base_url="https://api.example.com")
-
-        mock_response = Mock()
-        mock_response.json.side_effect = ValueError
+        with pytest.raises(NetworkError, match="Failed to fetch"):
+            fetcher.fetch_live_price("XAU")
 
-        with patch("requests.get", return_value=mock_response):
-            result = fetcher.fetch_live_price("XAU")
+    def test_fetch_price_invalid_json(self, fetcher, http_responses):
+        """Test that an invalid JSON body is reported as a fetch failure, as response.json() did."""
+        response = _Resp([])
+        response.content = b"not json"
+        http_responses[_api_url("XAU")] = response
 
-        assert result is None
+        with pytest.raises(NetworkError, match="Failed to fetch"):
+            fetcher.fetch_live_price("XAU")
 
-    def test_fetch_price_calculations(self):
+    def test_fetch_price_calculations(self, fetcher, http_responses):
         """Test price conversion calculations."""
-        fetcher = LivePriceFetcher(api_base_url="https://api.example.com")
+        http_responses[_api_url("XAU")] = _Resp(_GOLD_CALC_PAYLOAD)
 
-        mock_response = Mock()
-        mock_response.json.return_value = [
-            {
-                "ts": 1704067200000,
-                "spreadProfilePrices": [
-                    {"spreadProfile": "elite", "bid": 1861.00, "ask": 1863.00, "bidSpread": 0.5}  # EUR per troy ounce
-                ],
-            }
-        ]
-
-        with patch("requests.get", return_value=mock_response):
-            result = fetcher.fetch_live_price("XAU")
+        result = fetcher.fetch_live_price("XAU")
 
         # 1 troy ounce = 31.1035 grams
         # Mid price = (1861 + 1863) / 2 = 1862 EUR/oz
@@ -164,14 +189,42 @@ class TestFetchLivePrice:
         assert result["prices"]["eur_per_gram"]["mid"] > 50
 
 
+class TestParseResponse:
+    """Test decoding the API response body."""
+
+    def test_parse_valid_json(self, fetcher):
+        """Test that a JSON body is decoded."""
+        assert fetcher._parse_response(b'[{"ts": 1}]') == [{"ts": 1}]  # pylint: disable=protected-access
+
+    def test_parse_utf16_json(self, fetcher):
+        """Test that a UTF-16 JSON body is decoded like response.json() would."""
+        body = '[{"ts": 1}]'.encode("utf-16-le")
+
+        assert fetcher._parse_response(body) == [{"ts": 1}]  # pylint: disable=protected-access
+
+    def test_parse_json_null(self, fetcher):
+        """Test that a JSON null decodes to None rather than being treated as an error."""
+        assert fetcher._parse_response(b"null") is None  # pylint: disable=protected-access
+
+    def test_parse_non_finite_numbers(self, fetcher):
+        """Test that NaN and Infinity, which orjson rejects, still decode like response.json()."""
+        result = fetcher._parse_response(b'[NaN, Infinity]')  # pylint: disable=protected-access
+
+        assert math.isnan(result[0])
+        assert result[1] == math.inf
+
+    def test_parse_invalid_json(self, fetcher):
+        """Test that a malformed body raises requests' JSONDecodeError, a RequestException."""
+        with pytest.raises(requests.exceptions.JSONDecodeError):
+            fetcher._parse_response(b"not json")  # pylint: disable=protected-access
+
+
 class TestSavePrice:
     """Test saving price data to file."""
 
-    def test_save_price_new_file(self, tmp_path, monkeypatch):
+    @pytest.mark.usefixtures("fs")
+    def test_save_price_new_file(self, fetcher):
         """Test saving price to new file."""
-        monkeypatch.chdir(tmp_path)
-        fetcher = LivePriceFetcher(api_base_url="https://api.example.com")
-
         price_data = {
             "date": "2025-01-13",
             "metal": "XAU",
@@ -184,26 +237,20 @@ class TestSavePrice:
         assert result is True
 
         # Check file was created in correct path: data/live_prices/gold/2025-01-13.json
-        price_file = tmp_path / "data" / "live_prices" / "gold" / "2025-01-13.json"
+        price_file = _GOLD_PRICE_DIR / "2025-01-13.json"
         assert price_file.exists()
 
-        # Verify content
-        with open(price_file, encoding="utf-8") as f:
-            data = json.load(f)
-        assert isinstance(data, list)
-        assert len(data) == 1
-        assert data[0]["metal"] == "XAU"
+        # Verify content on the raw bytes: a JSON list holding a single entry for XAU
+        raw = price_file.read_bytes()
+        assert raw.startswith(b"[")
+        assert raw.count(b'"metal"') == 1
+        assert b'"metal": "XAU"' in raw
 
-    def test_save_price_append_to_existing(self, tmp_path, monkeypatch):
+    def test_save_price_append_to_existing(self, fetcher, fs):
         """Test appending price to existing file."""
-        monkeypatch.chdir(tmp_path)
-        fetcher = LivePriceFetcher(api_base_url="https://api.example.com")
-
         # Create existing file in correct path
-        live_price_dir = tmp_path / "data" / "live_prices" / "gold"
-        live_price_dir.mkdir(parents=True)
-        price_file = live_price_dir / "2025-01-13.json"
-        price_file.write_text('[{"old": "data"}]')
+        price_file = _GOLD_PRICE_DIR / "2025-01-13.json"
+        fs.create_file(price_file, contents='[{"old": "data"}]')
 
         price_data = {
             "date": "2025-01-13",
@@ -217,21 +264,15 @@ class TestSavePrice:
         assert result is True
 
         # Verify file was appended
-        with open(price_file, encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(price_file.read_bytes())
         assert len(data) == 2
         assert data[0]["old"] == "data"
         assert data[1]["metal"] == "XAU"
 
-    def test_save_price_io_error(self, tmp_path, monkeypatch):
+    def test_save_price_io_error(self, fetcher, fs):
         """Test handling IO error when saving."""
-        monkeypatch.chdir(tmp_path)
-        fetcher = LivePriceFetcher(api_base_url="https://api.example.com")
-
         # Create a directory where the file should be (causes write error)
-        live_price_dir = tmp_path / "data" / "live_prices" / "gold"
-        live_price_dir.mkdir(parents=True)
-        (live_price_dir / "2025-01-13.json").mkdir()  # Directory instead of file
+        fs.create_dir(_GOLD_PRICE_DIR / "2025-01-13.json")  # Directory instead of file
 
         price_data = {"date": "2025-01-13", "metal": "XAU", "metal_name": "gold"}
 
@@ -243,20 +284,11 @@ class TestSavePrice:
 class TestGetLatestPrice:
     """Test getting latest price without saving."""
 
-    def test_get_latest_price(self):
+    def test_get_latest_price(self, fetcher, http_responses):
         """Test getting latest price."""
-        fetcher = LivePriceFetcher(api_base_url="https://api.example.com")
-
-        mock_response = Mock()
-        mock_response.json.return_value = [
-            {
-                "ts": 1704067200000,
-                "spreadProfilePrices": [{"spreadProfile": "elite", "bid": 2000.00, "ask": 2010.00, "bidSpread": 0.5}],
-            }
-        ]
+        http_responses[_api_url("XAU")] = _Resp(_GOLD_ELITE_PAYLOAD)
 
-        with patch("requests.get", return_value=mock_response):
-            result = fetcher.get_latest_price("XAU")
+        result = fetcher.get_latest_price("XAU")
 
         assert result is not None
         assert result["metal"] == "XAU"
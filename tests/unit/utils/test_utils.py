@@ -4,7 +4,7 @@ Run with: pytest tests/test_utils.py -v
 """
 
 import pytest
-from src.igold_scraper.utils.parsing import (
+from igold_scraper.utils.parsing import (
     safe_float,
     parse_float_bg,
     calculate_spread,
@@ -13,116 +13,117 @@ from src.igold_scraper.utils.parsing import (
     sort_key_function,
 )
 
+pytestmark = pytest.mark.no_network
+
+_SAFE_FLOAT_CASES = (
+    ("5.99", 5.99),
+    ("1234.56", 1234.56),
+    ("0.1", 0.1),
+    ("5,99", 5.99),
+    ("1234,56", 1234.56),
+    ("  5.99  ", 5.99),
+    ("5,99 ", 5.99),
+    ("", None),
+    ("abc", None),
+    (None, None),
+)
+
+_PARSE_FLOAT_BG_CASES = (
+    ("6,45 гр.", 6.45),
+    ("5,99 лв.", 5.99),
+    ("5 838,00 лв.", 5838.0),
+    ("1 234,56", 1234.56),
+    ("1,23", 1.23),
+    ("100", 100.0),
+    ("", None),
+    ("abc", None),
+)
+
 
 class TestSafeFloat:
     """Tests for safe_float function."""
 
-    def test_valid_float(self):
-        """Test converting valid float strings."""
-        assert safe_float("5.99") == 5.99
-        assert safe_float("1234.56") == 1234.56
-        assert safe_float("0.1") == 0.1
-
-    def test_bulgarian_format(self):
-        """Test converting Bulgarian decimal separator (comma)."""
-        assert safe_float("5,99") == 5.99
-        assert safe_float("1234,56") == 1234.56
-
-    def test_with_whitespace(self):
-        """Test handling whitespace."""
-        assert safe_float("  5.99  ") == 5.99
-        assert safe_float("5,99 ") == 5.99
-
-    def test_invalid_input(self):
-        """Test handling invalid input."""
-        assert safe_float("") is None
-        assert safe_float("abc") is None
-        assert safe_float(None) is None
-
-    def test_with_default(self):
+    def test_safe_float(self):
+        """Test converting dot and comma decimals, surrounding whitespace and invalid input."""
+        assert [safe_float(value) for value, _ in _SAFE_FLOAT_CASES] == [
+            expected for _, expected in _SAFE_FLOAT_CASES
+        ]
+
+    @pytest.mark.parametrize("value,default", [("invalid", 0.0), (None, 10.0)])
+    def test_with_default(self, value, default):
         """Test default value."""
-        assert safe_float("invalid", default=0.0) == 0.0
-        assert safe_float(None, default=10.0) == 10.0
+        assert safe_float(value, default=default) == default
 
 
-class TestParseBulgarianFloat:
+class TestParseBulgarianFloat:  # pylint: disable=too-few-public-methods
     """Tests for parse_float_bg function."""
 
-    def test_with_units(self):
-        """Test parsing with units."""
-        assert parse_float_bg("6,45 гр.") == 6.45
-        assert parse_float_bg("5,99 лв.") == 5.99
+    def test_parse_float_bg(self):
+        """Test parsing with units, space thousands separators, plain numbers and invalid input."""
+        assert [parse_float_bg(value) for value, _ in _PARSE_FLOAT_BG_CASES] == [
+            expected for _, expected in _PARSE_FLOAT_BG_CASES
+        ]
 
-    def test_with_thousands_separator(self):
-        """Test parsing with space as thousands separator."""
-        assert parse_float_bg("5 838,00 лв.") == 5838.0
-        assert parse_float_bg("1 234,56") == 1234.56
 
-    def test_simple_numbers(self):
-        """Test simple number parsing."""
-        assert parse_float_bg("1,23") == 1.23
-        assert parse_float_bg("100") == 100.0
-
-    def test_invalid(self):
-        """Test invalid input."""
-        assert parse_float_bg("") is None
-        assert parse_float_bg("abc") is None
-
-
-class TestCalculateSpread:
+class TestCalculateSpread:  # pylint: disable=too-few-public-methods
     """Tests for calculate_spread function."""
 
-    def test_normal_spread(self):
-        """Test normal spread calculation."""
-        # spread = ((110 - 100) / 110) * 100 = 9.09%
-        result = calculate_spread(100, 110)
-        assert result == pytest.approx(9.09, abs=0.01)
-
-    def test_zero_spread(self):
-        """Test zero spread."""
-        assert calculate_spread(100, 100) == 0.0
-
-    def test_invalid_inputs(self):
-        """Test invalid inputs."""
-        assert calculate_spread(0, 0) is None
-        assert calculate_spread(None, 100) is None
-        assert calculate_spread(100, None) is None
-        assert calculate_spread(-10, 100) is None
-
-
-class TestCalculatePricePerGram:
+    @pytest.mark.parametrize(
+        "buy,sell,expected",
+        [
+            # spread = ((110 - 100) / 110) * 100 = 9.09%
+            (100, 110, pytest.approx(9.09, abs=0.01)),
+            (100, 100, 0.0),
+            (0, 0, None),
+            (None, 100, None),
+            (100, None, None),
+            (-10, 100, None),
+        ],
+    )
+    def test_calculate_spread(self, buy, sell, expected):
+        """Test normal and zero spreads and invalid inputs."""
+        assert calculate_spread(buy, sell) == expected
+
+
+class TestCalculatePricePerGram:  # pylint: disable=too-few-public-methods
     """Tests for calculate_price_per_gram function."""
 
-    def test_valid_calculation(self):
-        """Test valid price per gram calculation."""
-        assert calculate_price_per_gram(100, 5) == 20.0
-        assert calculate_price_per_gram(50, 10) == 5.0
-        assert calculate_price_per_gram(952, 31.1035) == pytest.approx(30.61, abs=0.01)
-
-    def test_invalid_inputs(self):
-        """Test invalid inputs."""
-        assert calculate_price_per_gram(100, 0) is None
-        assert calculate_price_per_gram(None, 5) is None
-        assert calculate_price_per_gram(100, None) is None
-        assert calculate_price_per_gram(0, 5) is None
-
-
-class TestCalculateFineMetal:
+    @pytest.mark.parametrize(
+        "price,weight,expected",
+        [
+            (100, 5, 20.0),
+            (50, 10, 5.0),
+            (952, 31.1035, pytest.approx(30.61, abs=0.01)),
+            (100, 0, None),
+            (None, 5, None),
+            (100, None, None),
+            (0, 5, None),
+        ],
+    )
+    def test_calculate_price_per_gram(self, price, weight, expected):
+        """Test valid price per gram calculations and invalid inputs."""
+        assert calculate_price_per_gram(price, weight) == expected
+
+
+class TestCalculateFineMetal:  # pylint: disable=too-few-public-methods
     """Tests for calculate_fine_metal function."""
 
-    def test_valid_calculation(self):
-        """Test valid fine metal calculation."""
-        # 10g at 900 per mille = 9g fine
-        assert calculate_fine_metal(10, 900) == 9.0
-        # 100g at 1000 per mille = 100g fine
-        assert calculate_fine_metal(100, 1000) == 100.0
-
-    def test_invalid_inputs(self):
-        """Test invalid inputs."""
-        assert calculate_fine_metal(10, 0) is None
-        assert calculate_fine_metal(0, 900) is None
-        assert calculate_fine_metal(None, 900) is None
-        assert calculate_fine_metal(10, None) is None
+    @pytest.mark.parametrize(
+        "weight,purity,expected",
+        [
+            # 10g at 900 per mille = 9g fine
+            (10, 900, 9.0),
+            # 100g at 1000 per mille = 100g fine
+            (100, 1000, 100.0),
+            (10, 0, None),
+            (0, 900, None),
+            (None, 900, None),
+            (10, None, None),
+        ],
+    )
+    def test_calculate_fine_metal(self, weight, purity, expected):
+        """Test valid fine metal calculations and invalid inputs."""
+        assert calculate_fine_metal(weight, purity) == expected
 
 
 class TestSortKeyFunction:
@@ -142,17 +143,16 @@ class TestSortKeyFunction:
 
     def test_sort_order(self):
         """Test that items with price come before items without."""
-        item_with_price = {'price_per_g_fine_eur': 48.35}
-        item_without_price = {'price_per_g_fine_eur': None}
-        item_with_higher_price = {'price_per_g_fine_eur': 50.0}
-
-        items = [item_without_price, item_with_higher_price, item_with_price]
-        sorted_items = sorted(items, key=sort_key_function)
-
-        # Items with price come first, sorted by price ascending
-        assert sorted_items[0] == item_with_price
-        assert sorted_items[1] == item_with_higher_price
-        assert sorted_items[2] == item_without_price
+        # Expected order: priced items ascending by price, then unpriced items
+        items = [
+            {'price_per_g_fine_eur': 48.35},
+            {'price_per_g_fine_eur': 50.0},
+            {'price_per_g_fine_eur': None},
+        ]
+        keys = [sort_key_function(item) for item in items]
+
+        assert all(left < right for left, right in zip(keys, keys[1:]))
+        assert [key[0] for key in keys] == [0, 0, 1]
 
 
 if __name__ == '__main__':